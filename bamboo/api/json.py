@@ -59,27 +59,44 @@ def _has_valid_annotations(apiclass: t.Type[JsonApiData]) -> None:
         _check_annotation(typ)
 
 
-def _validate_obj(obj: t.Any, objtype: t.Type) -> bool:
+def _make_validator(objtype: t.Type) -> t.Callable[[t.Any], bool]:
     origin = get_origin(objtype)
     if origin is None:
         if objtype in TYPES_ARGS_SET:
-            return isinstance(obj, objtype)
+            return lambda obj: isinstance(obj, objtype)
         if issubclass(objtype, JsonApiData):
-            return isinstance(obj, (dict, objtype))
-        return False
+            types = (dict, objtype)
+            return lambda obj: isinstance(obj, types)
+        return lambda obj: False
     elif origin == list:
-        if len(obj):
-            item = obj[0]
-            inner_type = get_args(objtype)[0]
-            return _validate_obj(item, inner_type)
-        return True
+        validate_item = _make_validator(get_args(objtype)[0])
+        return lambda obj: not len(obj) or validate_item(obj[0])
     elif origin == t.Union:
-        is_good = False
-        for arg in get_args(objtype):
-            is_good = is_good or _validate_obj(obj, arg)
-        return is_good
+        # NOTE
+        #   Only Optional is admitted, so None is checked at first.
+        validate = _make_validator(get_args(objtype)[0])
+        return lambda obj: obj is None or validate(obj)
     else:
-        return False
+        return lambda obj: False
+
+
+# Fields of JsonApiData, i.e. attribute names and their types with the
+# types to be set, which are the inner ones of Optional, and validators.
+_Fields_t = t.Tuple[
+    t.Tuple[str, t.Type, t.Type, t.Callable[[t.Any], bool]],
+    ...
+]
+
+
+def _make_fields(apiclass: t.Type[JsonApiData]) -> _Fields_t:
+    fields = []
+    for key_def, type_def in t.get_type_hints(apiclass).items():
+        type_set = type_def
+        if get_origin(type_def) == t.Union:
+            type_set = get_args(type_def)[0]
+        validate = _make_validator(type_def)
+        fields.append((key_def, type_def, type_set, validate))
+    return tuple(fields)
 
 
 def _build_json_api(
@@ -87,11 +104,10 @@ def _build_json_api(
     data: t.Dict[str, t.Any]
 ) -> JsonApiData:
     instance = apiclass.__new__(apiclass)
-    annotations = t.get_type_hints(apiclass)
 
     # NOTE
     #   Ignore keys of data which is not defined in the apiclass.
-    for key_def, type_def in annotations.items():
+    for key_def, type_def, type_set, validate in apiclass.__bamboo_fields__:
 
         # Handle default values.
         if not (key_def in data or hasattr(apiclass, key_def)):
@@ -104,7 +120,7 @@ def _build_json_api(
             val = getattr(apiclass, key_def)
 
         # Validate types of values.
-        if not _validate_obj(val, type_def):
+        if not validate(val):
             raise ApiValidationFailedError(
                 "Invalid type was detected in received json data. "
                 f"Expected: {type_def.__name__}; "
@@ -113,10 +129,10 @@ def _build_json_api(
 
         # Set values of attributes to an instance of the apiclass.
         # Handle only the case in which the origin is t.Optional.
-        origin = get_origin(type_def)
-        if origin == t.Union:
-            type_def = get_args(type_def)[0]
-        _set_non_optional_value(instance, type_def, key_def, val)
+        if val is None:
+            setattr(instance, key_def, val)
+        else:
+            _set_non_optional_value(instance, type_set, key_def, val)
 
     return instance
 
@@ -130,7 +146,7 @@ def _set_non_optional_value(
     origin = get_origin(type_def)
     if origin is None:
         if issubclass(type_def, JsonApiData) and isinstance(val, dict):
-            setattr(instance, key_def, type_def(**val))
+            setattr(instance, key_def, _build_json_api(type_def, val))
         else:
             setattr(instance, key_def, val)
     elif origin == list:
@@ -155,8 +171,13 @@ def _build_list(
     inner_origin = get_origin(inner_type)
     if inner_origin is None:
         if issubclass(inner_type, JsonApiData):
+            # NOTE
+            #   Items are built directly, not through the constructor,
+            #   to skip copying every item as keyword arguments and as
+            #   attributes of a temporary instance.
             return [
-                inner_type(**item) if isinstance(item, dict) else item
+                _build_json_api(inner_type, item)
+                if isinstance(item, dict) else item
                 for item in val
             ]
         return val
@@ -173,7 +194,7 @@ def _extract_dict(api: JsonApiData) -> t.Dict[str, t.Any]:
     cls = type(api)
     res = {}
 
-    for key, type_def in t.get_type_hints(cls).items():
+    for key, type_def, _, _ in cls.__bamboo_fields__:
         if hasattr(api, key):
             val = getattr(api, key)
             if isinstance(val, JsonApiData):
@@ -224,8 +245,14 @@ class JsonApiData(ApiData):
         ```
     """
 
+    # NOTE
+    #   Type hints are resolved once per class, not on every validation.
+    #   Don't annotate it, or it will be regarded as one of the fields.
+    __bamboo_fields__ = ()
+
     def __init_subclass__(cls) -> None:
         _has_valid_annotations(cls)
+        cls.__bamboo_fields__ = _make_fields(cls)
 
     # NOTE
     #   DO NOT override the method. This class should be used only
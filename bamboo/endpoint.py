@@ -626,7 +626,7 @@ class HTTPMixIn(metaclass=ABCMeta):
             can use the 'add_header' method.
 
         Args:
-            **headers: Header's info whose header is the field name.
+            *headers: Pairs of field names and values of the headers.
         """
         for name, val in headers:
             self.add_header(name, val)
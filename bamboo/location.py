@@ -20,6 +20,10 @@ class FlexibleLocation(metaclass=ABCMeta):
     is valid in the rules.
     """
 
+    # Marker to tell flexible locations from static ones without
+    # `isinstance`, which is slow for classes with `ABCMeta`
+    _is_flex = True
+
     @abstractmethod
     def is_valid(self, loc: str) -> bool:
         pass
@@ -43,10 +47,7 @@ def is_flexible_uri(uri: Uri_t) -> bool:
         True if specified `uri` has one or more flexible location,
         False otherwise.
     """
-    for loc in uri:
-        if isinstance(loc, FlexibleLocation):
-            return True
-    return False
+    return any(getattr(loc, "_is_flex", False) for loc in uri)
 
 
 def is_duplicated_uri(uri_1: Uri_t, uri_2: Uri_t) -> bool:
@@ -59,18 +60,15 @@ def is_duplicated_uri(uri_1: Uri_t, uri_2: Uri_t) -> bool:
     Returns:
         True if two URIs has same pattern, False otherwise.
     """
-    if len(uri_1) == len(uri_2):
-        for loc_1, loc_2 in zip(uri_1, uri_2):
-            if isinstance(loc_1, FlexibleLocation):
-                continue
-            if isinstance(loc_2, FlexibleLocation):
-                continue
-
-            if loc_1 != loc_2:
-                break
-        else:
-            return True
-    return False
+    if len(uri_1) != len(uri_2):
+        return False
+
+    return all(
+        loc_1 == loc_2
+        or getattr(loc_1, "_is_flex", False)
+        or getattr(loc_2, "_is_flex", False)
+        for loc_1, loc_2 in zip(uri_1, uri_2)
+    )
 
 
 class AsciiDigitLocation(FlexibleLocation):
@@ -1,10 +1,12 @@
+from collections import OrderedDict
+import sys
+import threading
 import typing as t
 
 from .location import (
     FlexibleLocation,
+    Location_t,
     Uri_t,
-    is_flexible_uri,
-    is_duplicated_uri,
 )
 
 
@@ -14,6 +16,8 @@ __all__ = []
 HTTPMethod_t = str
 Endpoint_t = t.TypeVar("Endpoint_t")
 Uri2Endpoints_t = t.Dict[Uri_t, t.Type[Endpoint_t]]
+Validation_t = t.Tuple[t.Tuple[str, ...], t.Optional[t.Type[Endpoint_t]]]
+LocValidator_t = t.Callable[[str], bool]
 
 
 class DuplicatedUriRegisteredError(Exception):
@@ -21,14 +25,206 @@ class DuplicatedUriRegisteredError(Exception):
     pass
 
 
+class _TrieNode:
+    """Node of trie storing URI patterns segment by segment.
+
+    Static locations are indexed by their strings and flexible locations
+    are kept in the order they were registered, so that looking a path up
+    costs time proportional to its depth, not to the number of routes.
+    Flexible locations are stored with their bound `is_valid` methods to
+    skip resolving the methods while matching.
+
+    Each node also holds the smallest registration index of URI patterns
+    passing through it. If several URI patterns match a path, the one
+    registered first wins, and subtrees which cannot contain an earlier
+    one are skipped.
+
+    Note:
+        Nodes are intentionally kept as objects holding their own children
+        instead of being flattened into one table keyed by pairs of node
+        IDs and locations. On CPython, building the tuple key for every
+        location costs more than the attribute access it saves.
+    """
+
+    __slots__ = ("static", "flex", "endpoint", "uri", "index")
+
+    def __init__(self, index: int = 0) -> None:
+        self.static: t.Dict[str, _TrieNode] = {}
+        self.flex: t.List[
+            t.Tuple[FlexibleLocation, LocValidator_t, _TrieNode]
+        ] = []
+        self.endpoint: t.Optional[t.Type[Endpoint_t]] = None
+        self.uri: t.Optional[Uri_t] = None
+        self.index = index
+
+    def insert(
+        self,
+        uri: Uri_t,
+        flags: t.Tuple[bool, ...],
+        index: int = 0,
+    ) -> "_TrieNode":
+        """Insert specified `uri` and retrieve the node of its end.
+
+        Note:
+            URI patterns must be inserted in ascending order of `index`,
+            so that nodes keep the smallest index of their descendants
+            and flexible children stay sorted by their indices.
+
+        Args:
+            uri: URI pattern to be inserted.
+            flags: Flags representing if each location of `uri` is
+                flexible or not.
+            index: Registration index of `uri`.
+
+        Returns:
+            Node corresponding to the last location of the `uri`.
+        """
+        node = self
+        for loc, flexible in zip(uri, flags):
+            node = node._child(loc, flexible, index)
+        node.uri = uri
+        return node
+
+    def _child(
+        self,
+        loc: Location_t,
+        flexible: bool,
+        index: int,
+    ) -> "_TrieNode":
+        if flexible:
+            for loc_flex, _, child in self.flex:
+                if loc_flex is loc:
+                    return child
+
+            child = _TrieNode(index)
+            self.flex.append((loc, loc.is_valid, child))
+            return child
+
+        child = self.static.get(loc)
+        if child is None:
+            child = self.static[loc] = _TrieNode(index)
+        return child
+
+    def find_conflict(
+        self,
+        uri: Uri_t,
+        flags: t.Tuple[bool, ...],
+        depth: int = 0,
+    ) -> t.Optional[Uri_t]:
+        """Find URI pattern already inserted which `uri` conflicts with.
+
+        Note:
+            Two URI patterns conflict if they have the same length and
+            every pair of their locations at the same position are equal
+            or either of them is flexible, i.e. same criteria as
+            `bamboo.location.is_duplicated_uri()`.
+
+        Args:
+            uri: URI pattern to be judged.
+            flags: Flags representing if each location of `uri` is
+                flexible or not.
+            depth: Position of the location of `uri` the node corresponds to.
+
+        Returns:
+            URI pattern conflicting with `uri` if found, None otherwise.
+        """
+        if depth == len(uri):
+            return self.uri
+
+        if flags[depth]:
+            children = list(self.static.values())
+        else:
+            child = self.static.get(uri[depth])
+            children = [] if child is None else [child]
+        children.extend(child for _, _, child in self.flex)
+
+        for child in children:
+            uri_conflicting = child.find_conflict(uri, flags, depth + 1)
+            if uri_conflicting is not None:
+                return uri_conflicting
+        return None
+
+    def match(
+        self,
+        locs: t.Sequence[str],
+        depth: int = 0,
+        bound: int = sys.maxsize,
+    ) -> t.Optional[t.Tuple[int, t.Tuple[str, ...], t.Type[Endpoint_t]]]:
+        """Search `Endpoint` whose URI pattern matches specified `locs`.
+
+        Note:
+            If several URI patterns match `locs`, the one with the smallest
+            registration index is chosen regardless of whether locations
+            are static or flexible.
+
+        Args:
+            locs: Locations of path of URI requested.
+            depth: Position of the location of `locs` the node corresponds to.
+            bound: Registration index which found URI patterns must be
+                smaller than.
+
+        Returns:
+            Registration index of the URI pattern found, values of its
+            flexible locations and its `Endpoint` if found, None otherwise.
+        """
+        if depth == len(locs):
+            if self.endpoint is None:
+                return None
+            return (self.index, (), self.endpoint)
+
+        best = None
+        loc = locs[depth]
+        child = self.static.get(loc)
+        if child is not None and child.index < bound:
+            best = child.match(locs, depth + 1, bound)
+            if best is not None:
+                bound = best[0]
+
+        # Flexible children are sorted by their indices
+        for _, is_valid, child in self.flex:
+            if child.index >= bound:
+                break
+            if is_valid(loc):
+                result = child.match(locs, depth + 1, bound)
+                if result is not None:
+                    index, flexibles_received, endpoint = result
+                    best = (index, (loc,) + flexibles_received, endpoint)
+                    bound = index
+        return best
+
+
 class Router(t.Generic[Endpoint_t]):
     """Operator of routing request to `Endpoint` by URI.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache_size: int = 1024) -> None:
+        """
+        Args:
+            cache_size: Max number of paths of URIs whose results of
+                validation with flexible URI patterns are cached.
+        """
         self._raw_uri2endpoint: Uri2Endpoints_t = {}
         self.uri2endpoint: Uri2Endpoints_t = {}
-        self.uris_flexible: t.List[Uri_t] = []
+        self._uri2flags: t.Dict[Uri_t, t.Tuple[bool, ...]] = {}
+        self._raw_by_depth: t.Dict[int, _TrieNode] = {}
+        self._by_endpoint: t.Dict[t.Type[Endpoint_t], t.List[Uri_t]] = {}
+
+        # Structures for validation built from 'uri2endpoint' lazily
+        # NOTE
+        #   The static routes, the flexible tries and the cache of results
+        #   are replaced together as one tuple, so that results computed
+        #   with old tries never go into the cache of new ones.
+        self._frozen = False
+        self._tables: t.Tuple[
+            t.Dict[str, t.Type[Endpoint_t]],
+            t.Dict[int, _TrieNode],
+            "OrderedDict[str, Validation_t]",
+        ] = ({}, {}, OrderedDict())
+        self._cache_size = cache_size
+
+        # Registrations and rebuilding of the structures for validation
+        # are serialized, so URI patterns can be registered while serving
+        self._lock = threading.Lock()
 
     def register(
         self,
@@ -47,28 +243,125 @@ class Router(t.Generic[Endpoint_t]):
             DuplicatedUriRegisteredError: Raised if given URI pattern
                 matches one already registered.
         """
-        for uri_registered in self._raw_uri2endpoint.keys():
-            if is_duplicated_uri(uri_registered, uri):
-                raise DuplicatedUriRegisteredError(
-                    "Duplicated URIs were detected.\n"
-                    f"URI pattern 1: {uri_registered}\n"
-                    f"URI pattern 2: {uri}"
-                )
-        else:
-            self._raw_uri2endpoint[uri] = endpoint
+        with self._lock:
+            self._register(uri, endpoint, version)
+
+    def _register(
+        self,
+        uri: Uri_t,
+        endpoint: t.Type[Endpoint_t],
+        version: t.Union[str, t.Tuple[str, ...]],
+    ) -> None:
+        # Only URI patterns with the same depth can be duplicated
+        raw_root = self._raw_by_depth.get(len(uri))
+        if raw_root is None:
+            raw_root = self._raw_by_depth[len(uri)] = _TrieNode()
+
+        # Flags are computed once since the locations are judged many times
+        flags = tuple(getattr(loc, "_is_flex", False) for loc in uri)
+
+        # Static locations shared by many URI patterns are stored as one
+        # object, and compared by identity first in lookups of the tries
+        # NOTE
+        #   Only exact 'str' can be interned, so instances of subclasses
+        #   of 'str', e.g. members of 'Enum', are stored as they are.
+        uri = tuple(
+            sys.intern(loc) if not flexible and type(loc) is str else loc
+            for loc, flexible in zip(uri, flags)
+        )
+        uri_registered = raw_root.find_conflict(uri, flags)
+        if uri_registered is not None:
+            raise DuplicatedUriRegisteredError(
+                "Duplicated URIs were detected.\n"
+                f"URI pattern 1: {uri_registered}\n"
+                f"URI pattern 2: {uri}"
+            )
+
+        raw_root.insert(uri, flags).endpoint = endpoint
+        self._raw_uri2endpoint[uri] = endpoint
 
         if isinstance(version, str):
             version = (version,)
 
         if len(version):
-            uris = [(ver,) + uri for ver in version]
+            uris = [
+                (sys.intern(ver) if type(ver) is str else ver,) + uri
+                for ver in version
+            ]
+            flags = (False,) + flags
         else:
             uris = [uri]
 
         for _uri in uris:
-            if is_flexible_uri(_uri):
-                self.uris_flexible.append(_uri)
+            endpoint_prev = self.uri2endpoint.get(_uri)
+            if endpoint_prev is not None:
+                self._by_endpoint[endpoint_prev].remove(_uri)
             self.uri2endpoint[_uri] = endpoint
+            self._uri2flags[_uri] = flags
+            self._by_endpoint.setdefault(endpoint, []).append(_uri)
+
+        self._frozen = False
+
+    def register_many(
+        self,
+        routes: t.Iterable[t.Tuple[Uri_t, t.Type[Endpoint_t]]],
+        version: t.Union[str, t.Tuple[str, ...]] = ()
+    ) -> None:
+        """Register combinations of URIs and `Endpoint`s at once.
+
+        Note:
+            This method is equivalent to calling `register()` for each
+            combination. Structures for validation are built only once
+            on the next validation, not for each combination.
+
+        Args:
+            routes: Pairs of URI patterns and `Endpoint` classes.
+            version: Version of the `Endpoint`s.
+
+        Raises:
+            DuplicatedUriRegisteredError: Raised if any of given URI
+                patterns matches one already registered.
+        """
+        with self._lock:
+            for uri, endpoint in routes:
+                self._register(uri, endpoint, version)
+
+    def _freeze(self) -> None:
+        """Build structures for validation from registered URI patterns.
+
+        Note:
+            Since URI patterns are registered mostly before any request
+            comes, the structures are rebuilt at once on validation after
+            registrations instead of being updated on every registration.
+        """
+        with self._lock:
+            # Another thread may have rebuilt them while waiting the lock
+            if not self._frozen:
+                self._build_tables()
+
+    def _build_tables(self) -> None:
+        static: t.Dict[str, t.Type[Endpoint_t]] = {}
+        flex_by_depth: t.Dict[int, _TrieNode] = {}
+        # NOTE
+        #   'uri2endpoint' keeps URI patterns in the order they were
+        #   registered first, which is used as their registration indices.
+        for index, (uri, endpoint) in enumerate(self.uri2endpoint.items()):
+            flags = self._uri2flags[uri]
+            if any(flags):
+                root = flex_by_depth.get(len(uri))
+                if root is None:
+                    root = flex_by_depth[len(uri)] = _TrieNode(index)
+                root.insert(uri, flags, index).endpoint = endpoint
+            elif not any("/" in loc for loc in uri):
+                # Locations including '/' never match any location of
+                # paths, and would be confused with other URI patterns
+                # if joined into one path
+                static["/" + "/".join(uri)] = endpoint
+
+        # Results cached so far may be changed by new URI patterns, so
+        # the new structures come with an empty cache
+        self._tables = (static, flex_by_depth, OrderedDict())
+        self._frozen = True
 
     def validate(
         self,
@@ -88,6 +381,17 @@ class Router(t.Generic[Endpoint_t]):
             as sequence of flexible locations and `None` as `Endpoint`, or
             `((), None)`.
 
+            Any number of '/' at the both ends of `uri` are ignored, so
+            `uri` without the leading '/' or with repeated ones at the ends,
+            e.g. 'test/hoge', '//test/hoge' and '/test/hoge//', is validated
+            as same as '/test/hoge'. Repeated '/' between locations are not
+            ignored, so such `uri` doesn't match any URI patterns.
+
+            URI patterns with only static locations are looked up first.
+            If several URI patterns with flexible locations match `uri`,
+            the one registered first is chosen, even if static locations
+            of another one match more locations of `uri`.
+
         Args:
             uri: Path of URI.
 
@@ -95,38 +399,53 @@ class Router(t.Generic[Endpoint_t]):
             Pair of values of flexible locations and `Endpoint` if specified
             `uri` is valid.
         """
-        uri = tuple(uri[1:].split("/"))
-        if not uri[0]:
-            uri = ()
+        if not self._frozen:
+            self._freeze()
 
-        endpoint = self.uri2endpoint.get(uri)
-        if endpoint:
+        # The structures are read at once, not to mix different versions
+        static, flex_by_depth, cache = self._tables
+
+        endpoint = static.get(uri)
+        if endpoint is not None:
             return ((), endpoint)
 
-        depth = len(uri)
-        for flexible in self.uris_flexible:
-            if len(flexible) != depth:
-                continue
+        # Any '/' at the both ends of 'uri' are ignored, including the
+        # leading one, so 'uri' needn't start with '/'
+        path = uri.strip("/")
+        if "/" + path != uri:
+            endpoint = static.get("/" + path)
+            if endpoint is not None:
+                return ((), endpoint)
 
-            flexibles_received = []
+        # Only flexible URIs with the same depth can match, so paths of
+        # other depths are rejected before splitting and caching them
+        root = flex_by_depth.get(path.count("/") + 1 if path else 0)
+        if root is None:
+            return ((), None)
 
-            # Judging each locations
-            for loc_req, loc_flex in zip(uri, flexible):
-                if isinstance(loc_flex, FlexibleLocation):
-                    if not loc_flex.is_valid(loc_req):
-                        break
+        result = cache.get(uri)
+        if result is not None:
+            try:
+                cache.move_to_end(uri)
+            except KeyError:
+                # Evicted by another thread
+                pass
+            return result
 
-                    flexibles_received.append(loc_req)
-                else:
-                    if loc_req != loc_flex:
-                        break
-            else:
-                # Correct case
-                endpoint = self.uri2endpoint.get(flexible)
-                return (tuple(flexibles_received), endpoint)
+        result = root.match(path.split("/"))
+        if result is None:
+            # Could not find it
+            result = ((), None)
+        else:
+            result = result[1:]
 
-        # Could not find it
-        return ((), None)
+        cache[uri] = result
+        if len(cache) > self._cache_size:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                pass
+        return result
 
     def search_uris(self, endpoint: t.Type[Endpoint_t]) -> t.List[Uri_t]:
         """Search URI patterns of specified `endpoint`.
@@ -137,7 +456,4 @@ class Router(t.Generic[Endpoint_t]):
         Returns:
             Result of searching.
         """
-        return [
-            uri for uri, point in self.uri2endpoint.items()
-            if point is endpoint
-        ]
+        return list(self._by_endpoint.get(endpoint, ()))
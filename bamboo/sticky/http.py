@@ -3,7 +3,7 @@ import dataclasses
 import functools
 import inspect
 import ipaddress
-import re
+import sys
 import typing as t
 
 from . import (
@@ -35,6 +35,15 @@ from ..http import AuthSchemes, HTTPStatus
 from ..util.convert import decode2binary
 
 
+# NOTE
+#   Information of sticky configs is read on every request, so instances
+#   are made without `__dict__` where the `slots` option is available
+#   (Python 3.10 or later).
+_INFO_OPTIONS: t.Dict[str, bool] = {"eq": True, "frozen": True}
+if sys.version_info >= (3, 10):
+    _INFO_OPTIONS["slots"] = True
+
+
 class CallbackConfigBase(metaclass=ABCMeta):
 
     ATTR: str
@@ -77,8 +86,7 @@ class HTTPErrorConfig(CallbackConfigBase):
         return tuple(self._registered)
 
     def set(self, *errors: t.Type[ErrInfo]) -> Callback_t:
-        for err in errors:
-            self._registered.add(err)
+        self._registered.update(errors)
         return self._callback
 
 
@@ -121,7 +129,7 @@ def may_occur(*errors: t.Type[ErrInfo]) -> CallbackDecorator_t:
     return wrapper
 
 
-@dataclasses.dataclass(eq=True, frozen=True)
+@dataclasses.dataclass(**_INFO_OPTIONS)
 class DataFormatInfo:
     """`dataclass` with information of data format at callbacks on `Endpoint`.
 
@@ -175,15 +183,18 @@ class DataFormatConfig(CallbackConfigBase):
         dataformat: DataFormatInfo
     ) -> Callback_WSGI_t:
 
+        validate = dataformat.input.__validate__
+        err_validate = dataformat.err_validate
+
         @functools.wraps(callback)
-        @may_occur(dataformat.err_validate.__class__)
+        @may_occur(err_validate.__class__)
         @has_header_of("Content-Type", dataformat.err_noheader, add_arg=False)
         def _callback(self: WSGIEndpoint, *args) -> None:
             body = self.body
             try:
-                data = dataformat.input.__validate__(body, self.content_type)
+                data = validate(body, self.content_type)
             except ApiValidationFailedError:
-                raise dataformat.err_validate
+                raise err_validate
             callback(self, data, *args)
 
         return _callback
@@ -196,7 +207,10 @@ class DataFormatConfig(CallbackConfigBase):
 
         @functools.wraps(callback)
         def _callback(self: WSGIEndpoint, *args) -> None:
-            setattr(self, "body", b"")
+            # NOTE
+            #   `body` is a non-data descriptor, so the value in the
+            #   instance dictionary shadows it.
+            self.__dict__["body"] = b""
             callback(self, *args)
 
         return _callback
@@ -207,15 +221,18 @@ class DataFormatConfig(CallbackConfigBase):
         dataformat: DataFormatInfo
     ) -> Callback_ASGI_t:
 
+        validate = dataformat.input.__validate__
+        err_validate = dataformat.err_validate
+
         @functools.wraps(callback)
-        @may_occur(dataformat.err_validate.__class__)
+        @may_occur(err_validate.__class__)
         @has_header_of("Content-Type", dataformat.err_noheader, add_arg=False)
         async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
             body = await self.body
             try:
-                data = dataformat.input.__validate__(body, self.content_type)
+                data = validate(body, self.content_type)
             except ApiValidationFailedError:
-                raise dataformat.err_validate
+                raise err_validate
             await callback(self, data, *args)
 
         return _callback
@@ -295,7 +312,7 @@ def data_format(
     return wrapper
 
 
-@dataclasses.dataclass(eq=True, frozen=True)
+@dataclasses.dataclass(**_INFO_OPTIONS)
 class RequiredHeaderInfo:
     """`dataclass` with information of header which should be included in
     response headers.
@@ -342,20 +359,36 @@ class RequiredHeaderConfig(CallbackConfigBase):
         info: RequiredHeaderInfo,
     ) -> Callback_WSGI_t:
 
-        @functools.wraps(callback)
-        def _callback(self: WSGIEndpoint, *args) -> None:
-            val = self.get_header(info.header)
-            if val is None and info.err:
-                raise info.err
+        header = info.header
+        err = info.err
 
-            if info.add_arg:
+        # Wrappers are specialized for each combination of the options
+        # so that they don't judge the options on every request
+        if not err:
+            if not info.add_arg:
+                return callback
+
+            @functools.wraps(callback)
+            def _callback(self: WSGIEndpoint, *args) -> None:
+                callback(self, self.get_header(header), *args)
+
+            return _callback
+
+        if info.add_arg:
+            @functools.wraps(callback)
+            def _callback(self: WSGIEndpoint, *args) -> None:
+                val = self.get_header(header)
+                if val is None:
+                    raise err
                 callback(self, val, *args)
-            else:
+        else:
+            @functools.wraps(callback)
+            def _callback(self: WSGIEndpoint, *args) -> None:
+                if self.get_header(header) is None:
+                    raise err
                 callback(self, *args)
 
-        if info.err:
-            _callback = may_occur(info.err.__class__)(_callback)
-        return _callback
+        return may_occur(err.__class__)(_callback)
 
     @staticmethod
     def decorate_asgi(
@@ -363,20 +396,36 @@ class RequiredHeaderConfig(CallbackConfigBase):
         info: RequiredHeaderInfo,
     ) -> Callback_ASGI_t:
 
-        @functools.wraps(callback)
-        async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
-            val = self.get_header(info.header)
-            if val is None and info.err:
-                raise info.err
+        header = info.header
+        err = info.err
 
-            if info.add_arg:
+        # Wrappers are specialized for each combination of the options
+        # so that they don't judge the options on every request
+        if not err:
+            if not info.add_arg:
+                return callback
+
+            @functools.wraps(callback)
+            async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
+                await callback(self, self.get_header(header), *args)
+
+            return _callback
+
+        if info.add_arg:
+            @functools.wraps(callback)
+            async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
+                val = self.get_header(header)
+                if val is None:
+                    raise err
                 await callback(self, val, *args)
-            else:
+        else:
+            @functools.wraps(callback)
+            async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
+                if self.get_header(header) is None:
+                    raise err
                 await callback(self, *args)
 
-        if info.err:
-            _callback = may_occur(info.err.__class__)(_callback)
-        return _callback
+        return may_occur(err.__class__)(_callback)
 
 
 def has_header_of(
@@ -425,28 +474,65 @@ def has_header_of(
     return wrapper
 
 
-@dataclasses.dataclass(eq=True, frozen=True)
+@dataclasses.dataclass(**_INFO_OPTIONS)
 class ClientInfo:
 
     ip: t.Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
     port: t.Optional[int] = None
 
 
-_RestrictedClient_t = t.Dict[
-    t.Union[ipaddress.IPv4Address, ipaddress.IPv6Address],
-    t.Set[t.Optional[int]]
-]
+_IPAddress_t = t.Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+_RestrictedClient_t = t.Dict[_IPAddress_t, t.Set[t.Optional[int]]]
+
+
+class _AcceptableClients:
+    """Clients allowed to request, compiled for lookups on requests.
+
+    Addresses are held as their compressed text forms, so that addresses
+    given by servers can be looked up without parsing them.
+
+    Attributes:
+        ips_any_port: IP addresses allowed from any port.
+        addrs: Pairs of IP addresses and ports allowed.
+    """
+
+    __slots__ = ("ips_any_port", "addrs")
+
+    def __init__(self) -> None:
+        self.ips_any_port: t.FrozenSet[str] = frozenset()
+        self.addrs: t.FrozenSet[t.Tuple[str, int]] = frozenset()
+
+    def compile(self, registered: _RestrictedClient_t) -> None:
+        self.ips_any_port = frozenset(
+            str(ip) for ip, ports in registered.items() if None in ports
+        )
+        self.addrs = frozenset(
+            (str(ip), port) for ip, ports in registered.items()
+            for port in ports if port is not None
+        )
+
+    def accepts(self, ip: str, port: t.Optional[int]) -> bool:
+        if ip in self.ips_any_port or (ip, port) in self.addrs:
+            return True
+
+        # NOTE
+        #   Only addresses spelled in other forms than the compressed one
+        #   are parsed, e.g. IPv6 addresses with leading zeros.
+        ip = str(ipaddress.ip_address(ip))
+        return ip in self.ips_any_port or (ip, port) in self.addrs
 
 
 class RestrictedClientsConfig(CallbackConfigBase):
 
     ATTR = _get_bamboo_attr("restricted_clients")
+    ATTR_COMPILED = _get_bamboo_attr("restricted_clients_compiled")
 
     def __init__(self, callback: Callback_t) -> None:
         super().__init__()
 
         if not hasattr(callback, self.ATTR):
             setattr(callback, self.ATTR, {})
+            setattr(callback, self.ATTR_COMPILED, _AcceptableClients())
 
         self._callback = callback
         self._registered: _RestrictedClient_t = getattr(callback, self.ATTR)
@@ -465,6 +551,11 @@ class RestrictedClientsConfig(CallbackConfigBase):
                 self._registered[client.ip] = set()
             self._registered[client.ip].add(client.port)
 
+        # NOTE
+        #   The compiled clients are shared with the wrappers of former
+        #   decorations, so all of them accept the same clients.
+        getattr(self._callback, self.ATTR_COMPILED).compile(self._registered)
+
         if inspect.iscoroutinefunction(self._callback):
             func = self.decorate_asgi
         else:
@@ -477,20 +568,13 @@ class RestrictedClientsConfig(CallbackConfigBase):
         callback: Callback_WSGI_t,
         err: ErrInfo
     ) -> Callback_WSGI_t:
-        acceptables = getattr(callback, cls.ATTR, set())
+        acceptables: _AcceptableClients = getattr(callback, cls.ATTR_COMPILED)
 
         @functools.wraps(callback)
         @may_occur(err.__class__)
         def _callback(self: WSGIEndpoint, *args) -> None:
             ip, port = self.get_client_addr()
-            if ip is None:
-                raise err
-
-            client = ClientInfo(ipaddress.ip_address(ip), port)
-            ports = acceptables.get(client.ip)
-            if ports is None:
-                raise err
-            if not(None in ports or client.port in ports):
+            if ip is None or not acceptables.accepts(ip, port):
                 raise err
             callback(self, *args)
 
@@ -502,20 +586,13 @@ class RestrictedClientsConfig(CallbackConfigBase):
         callback: Callback_ASGI_t,
         err: ErrInfo
     ) -> Callback_ASGI_t:
-        acceptables = getattr(callback, cls.ATTR, set())
+        acceptables: _AcceptableClients = getattr(callback, cls.ATTR_COMPILED)
 
         @functools.wraps(callback)
         @may_occur(err.__class__)
         async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
             ip, port = self.get_client_addr()
-            if ip is None:
-                raise err
-
-            client = ClientInfo(ipaddress.ip_address(ip), port)
-            ports = acceptables.get(client.ip)
-            if ports is None:
-                raise err
-            if not(None in ports or client.port in ports):
+            if ip is None or not acceptables.accepts(ip, port):
                 raise err
             await callback(self, *args)
 
@@ -571,6 +648,12 @@ class AuthSchemeConfig(CallbackConfigBase):
     ATTR = _get_bamboo_attr("auth_scheme")
     HEADER_AUTHORIZATION = "Authorization"
 
+    # Names of decorating methods for WSGI and ASGI callbacks per scheme
+    _DECORATORS = {
+        AuthSchemes.basic: ("decorate_wsgi_basic", "decorate_asgi_basic"),
+        AuthSchemes.bearer: ("decorate_wsgi_bearer", "decorate_asgi_bearer"),
+    }
+
     def __init__(self, callback: Callback_t) -> None:
         super().__init__()
 
@@ -587,32 +670,20 @@ class AuthSchemeConfig(CallbackConfigBase):
                 f"'{_scheme_registered}'. Do not specify multiple schemes."
             )
 
-        if scheme not in AuthSchemes:
+        decorators = self._DECORATORS.get(scheme)
+        if decorators is None:
             raise ValueError(f"Specified scheme '{scheme}' is not supported.")
 
         setattr(self._callback, self.ATTR, scheme)
 
-        if scheme == AuthSchemes.basic:
-            if inspect.iscoroutinefunction(self._callback):
-                func = self.decorate_asgi_basic
-            else:
-                func = self.decorate_wsgi_basic
-        elif scheme == AuthSchemes.bearer:
-            if inspect.iscoroutinefunction(self._callback):
-                func = self.decorate_asgi_bearer
-            else:
-                func = self.decorate_wsgi_bearer
-
-        return func(self._callback, err)
+        wsgi, asgi = decorators
+        func = asgi if inspect.iscoroutinefunction(self._callback) else wsgi
+        return getattr(self, func)(self._callback, err)
 
     @staticmethod
     def _validate_auth_header(value: str, scheme: str) -> t.Optional[str]:
-        value = value.split(" ")
-        if len(value) != 2:
-            return None
-
-        _scheme, credentials = value
-        if _scheme != scheme:
+        _scheme, sep, credentials = value.partition(" ")
+        if not sep or _scheme != scheme or " " in credentials:
             return None
 
         return credentials
@@ -624,21 +695,25 @@ class AuthSchemeConfig(CallbackConfigBase):
         err: ErrInfo
     ) -> Callback_WSGI_t:
 
+        header = cls.HEADER_AUTHORIZATION
+        scheme = AuthSchemes.basic
+        validate_auth_header = cls._validate_auth_header
+
         @functools.wraps(callback)
         @may_occur(err.__class__)
-        @has_header_of(cls.HEADER_AUTHORIZATION, err, add_arg=False)
+        @has_header_of(header, err, add_arg=False)
         def _callback(self: WSGIEndpoint, *args) -> None:
-            val = self.get_header(cls.HEADER_AUTHORIZATION)
-            credentials = cls._validate_auth_header(val, AuthSchemes.basic)
+            val = self.get_header(header)
+            credentials = validate_auth_header(val, scheme)
             if credentials is None:
                 raise err
 
-            credentials = decode2binary(credentials).decode().split(":")
-            if len(credentials) != 2:
+            # User ID can't include ':', but password can (RFC 7617)
+            user_id, sep, pw = decode2binary(credentials).partition(b":")
+            if not sep:
                 raise err
 
-            user_id, pw = credentials
-            callback(self, user_id, pw, *args)
+            callback(self, user_id.decode(), pw.decode(), *args)
 
         return _callback
 
@@ -649,21 +724,25 @@ class AuthSchemeConfig(CallbackConfigBase):
         err: ErrInfo
     ) -> Callback_ASGI_t:
 
+        header = cls.HEADER_AUTHORIZATION
+        scheme = AuthSchemes.basic
+        validate_auth_header = cls._validate_auth_header
+
         @functools.wraps(callback)
         @may_occur(err.__class__)
-        @has_header_of(cls.HEADER_AUTHORIZATION, err, add_arg=False)
+        @has_header_of(header, err, add_arg=False)
         async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
-            val = self.get_header(cls.HEADER_AUTHORIZATION)
-            credentials = cls._validate_auth_header(val, AuthSchemes.basic)
+            val = self.get_header(header)
+            credentials = validate_auth_header(val, scheme)
             if credentials is None:
                 raise err
 
-            credentials = decode2binary(credentials).decode().split(":")
-            if len(credentials) != 2:
+            # User ID can't include ':', but password can (RFC 7617)
+            user_id, sep, pw = decode2binary(credentials).partition(b":")
+            if not sep:
                 raise err
 
-            user_id, pw = credentials
-            await callback(self, user_id, pw, *args)
+            await callback(self, user_id.decode(), pw.decode(), *args)
 
         return _callback
 
@@ -674,12 +753,16 @@ class AuthSchemeConfig(CallbackConfigBase):
         err: ErrInfo,
     ) -> Callback_WSGI_t:
 
+        header = cls.HEADER_AUTHORIZATION
+        scheme = AuthSchemes.bearer
+        validate_auth_header = cls._validate_auth_header
+
         @functools.wraps(callback)
         @may_occur(err.__class__)
-        @has_header_of(cls.HEADER_AUTHORIZATION, err, add_arg=False)
+        @has_header_of(header, err, add_arg=False)
         def _callback(self: WSGIEndpoint, *args) -> None:
-            val = self.get_header(cls.HEADER_AUTHORIZATION)
-            token = cls._validate_auth_header(val, AuthSchemes.bearer)
+            val = self.get_header(header)
+            token = validate_auth_header(val, scheme)
             if token is None:
                 raise err
             callback(self, token, *args)
@@ -693,12 +776,16 @@ class AuthSchemeConfig(CallbackConfigBase):
         err: ErrInfo,
     ) -> Callback_ASGI_t:
 
+        header = cls.HEADER_AUTHORIZATION
+        scheme = AuthSchemes.bearer
+        validate_auth_header = cls._validate_auth_header
+
         @functools.wraps(callback)
         @may_occur(err.__class__)
-        @has_header_of(cls.HEADER_AUTHORIZATION, err, add_arg=False)
+        @has_header_of(header, err, add_arg=False)
         async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
-            val = self.get_header(cls.HEADER_AUTHORIZATION)
-            token = cls._validate_auth_header(val, AuthSchemes.bearer)
+            val = self.get_header(header)
+            token = validate_auth_header(val, scheme)
             if token is None:
                 raise err
             await callback(self, token, *args)
@@ -781,7 +868,7 @@ def bearer_auth(
     return wrapper
 
 
-@dataclasses.dataclass(eq=True, frozen=True)
+@dataclasses.dataclass(**_INFO_OPTIONS)
 class RequiredQueryInfo:
 
     query: str
@@ -822,38 +909,46 @@ class RequiredQueryConfig(CallbackConfigBase):
         info: RequiredQueryInfo,
     ) -> Callback_WSGI_t:
 
+        query = info.query
+        err_empty = info.err_empty
+        err_not_unique = info.err_not_unique
+        mapf = info.mapf
+        add_arg = info.add_arg
+
+        # Nothing is done with the query if it is neither validated nor
+        # passed to the callback
+        err_classes = tuple(
+            err.__class__ for err in (err_empty, err_not_unique) if err
+        )
+        if not (err_classes or add_arg or mapf):
+            return callback
+
         @functools.wraps(callback)
         def _callback(self: WSGIEndpoint, *args) -> None:
-            val = self.get_queries(info.query)
+            val = self.get_queries(query)
             len_val = len(val)
 
             if len_val == 0:
-                if info.err_empty:
-                    raise info.err_empty
+                if err_empty:
+                    raise err_empty
                 else:
                     val = None
             elif len_val == 1:
                 val = val[0]
             else:
-                if info.err_not_unique:
-                    raise info.err_not_unique
+                if err_not_unique:
+                    raise err_not_unique
 
-            if info.mapf is not None:
-                val = info.mapf(val)
+            if mapf is not None:
+                val = mapf(val)
 
-            if info.add_arg:
+            if add_arg:
                 callback(self, val, *args)
             else:
                 callback(self, *args)
 
-        errs = []
-        if info.err_empty:
-            errs.append(info.err_empty.__class__)
-        if info.err_not_unique:
-            errs.append(info.err_not_unique.__class__)
-        if len(errs):
-            _callback = may_occur(*errs)(_callback)
-
+        if err_classes:
+            _callback = may_occur(*err_classes)(_callback)
         return _callback
 
     @staticmethod
@@ -862,38 +957,46 @@ class RequiredQueryConfig(CallbackConfigBase):
         info: RequiredQueryInfo,
     ) -> Callback_ASGI_t:
 
+        query = info.query
+        err_empty = info.err_empty
+        err_not_unique = info.err_not_unique
+        mapf = info.mapf
+        add_arg = info.add_arg
+
+        # Nothing is done with the query if it is neither validated nor
+        # passed to the callback
+        err_classes = tuple(
+            err.__class__ for err in (err_empty, err_not_unique) if err
+        )
+        if not (err_classes or add_arg or mapf):
+            return callback
+
         @functools.wraps(callback)
         async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
-            val = self.get_queries(info.query)
+            val = self.get_queries(query)
             len_val = len(val)
 
             if len_val == 0:
-                if info.err_empty:
-                    raise info.err_empty
+                if err_empty:
+                    raise err_empty
                 else:
                     val = None
             elif len_val == 1:
                 val = val[0]
             else:
-                if info.err_not_unique:
-                    raise info.err_not_unique
+                if err_not_unique:
+                    raise err_not_unique
 
-            if info.mapf is not None:
-                val = info.mapf(val)
+            if mapf is not None:
+                val = mapf(val)
 
-            if info.add_arg:
+            if add_arg:
                 await callback(self, val, *args)
             else:
                 await callback(self, *args)
 
-        errs = []
-        if info.err_empty:
-            errs.append(info.err_empty.__class__)
-        if info.err_not_unique:
-            errs.append(info.err_not_unique.__class__)
-        if len(errs):
-            _callback = may_occur(*errs)(_callback)
-
+        if err_classes:
+            _callback = may_occur(*err_classes)(_callback)
         return _callback
 
 
@@ -915,10 +1018,10 @@ def has_query_of(
     return wrapper
 
 
-@dataclasses.dataclass(eq=True, frozen=True)
+@dataclasses.dataclass(**_INFO_OPTIONS)
 class SimpleAccessControlInfo:
 
-    origins: t.Tuple[str] = ()
+    origins: t.FrozenSet[str] = frozenset()
     allow_credentials: bool = False
     err_not_allowed: ErrInfo = DEFAULT_CORS_ERROR
     add_arg: bool = True
@@ -954,29 +1057,48 @@ class SimpleAccessControlConfig(CallbackConfigBase):
         callback: Callback_WSGI_t,
         info: SimpleAccessControlInfo,
     ) -> Callback_WSGI_t:
-        origins = set(info.origins)
-
-        @functools.wraps(callback)
-        def _callback(self: WSGIEndpoint, *args) -> None:
-            # Origin
-            origin = self.get_header("Origin")
-            if origin:
-                if not len(origins):
-                    self.add_header("Access-Control-Allow-Origin", "*")
-                elif origin in origins:
-                    self.add_header("Access-Control-Allow-Origin", origin)
-                    self.add_header("Vary", "Origin")
+        origins = frozenset(info.origins)
+        err_not_allowed = info.err_not_allowed
+        allow_credentials = info.allow_credentials
+        add_arg = info.add_arg
+
+        # Wrappers are specialized by whether any origins are specified
+        if origins:
+            @functools.wraps(callback)
+            def _callback(self: WSGIEndpoint, *args) -> None:
+                # Origin
+                origin = self.get_header("Origin")
+                if origin:
+                    if origin in origins:
+                        self.add_header("Access-Control-Allow-Origin", origin)
+                        self.add_header("Vary", "Origin")
+                    else:
+                        raise err_not_allowed
+
+                # Credentials
+                if allow_credentials:
+                    self.add_header("Access-Control-Allow-Credentials", "true")
+
+                if add_arg:
+                    callback(self, origin, *args)
                 else:
-                    raise info.err_not_allowed
+                    callback(self, *args)
+        else:
+            @functools.wraps(callback)
+            def _callback(self: WSGIEndpoint, *args) -> None:
+                # Origin
+                origin = self.get_header("Origin")
+                if origin:
+                    self.add_header("Access-Control-Allow-Origin", "*")
 
-            # Credentials
-            if info.allow_credentials:
-                self.add_header("Access-Control-Allow-Credentials", "true")
+                # Credentials
+                if allow_credentials:
+                    self.add_header("Access-Control-Allow-Credentials", "true")
 
-            if info.add_arg:
-                callback(self, origin, *args)
-            else:
-                callback(self, *args)
+                if add_arg:
+                    callback(self, origin, *args)
+                else:
+                    callback(self, *args)
 
         if info.err_not_allowed:
             _callback = may_occur(info.err_not_allowed.__class__)(_callback)
@@ -987,29 +1109,48 @@ class SimpleAccessControlConfig(CallbackConfigBase):
         callback: Callback_ASGI_t,
         info: SimpleAccessControlInfo,
     ) -> Callback_ASGI_t:
-        origins = set(info.origins)
-
-        @functools.wraps(callback)
-        async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
-            # Origin
-            origin = self.get_header("Origin")
-            if origin:
-                if not len(origins):
-                    self.add_header("Access-Control-Allow-Origin", "*")
-                elif origin in origins:
-                    self.add_header("Access-Control-Allow-Origin", origin)
-                    self.add_header("Vary", "Origin")
+        origins = frozenset(info.origins)
+        err_not_allowed = info.err_not_allowed
+        allow_credentials = info.allow_credentials
+        add_arg = info.add_arg
+
+        # Wrappers are specialized by whether any origins are specified
+        if origins:
+            @functools.wraps(callback)
+            async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
+                # Origin
+                origin = self.get_header("Origin")
+                if origin:
+                    if origin in origins:
+                        self.add_header("Access-Control-Allow-Origin", origin)
+                        self.add_header("Vary", "Origin")
+                    else:
+                        raise err_not_allowed
+
+                # Credentials
+                if allow_credentials:
+                    self.add_header("Access-Control-Allow-Credentials", "true")
+
+                if add_arg:
+                    await callback(self, origin, *args)
                 else:
-                    raise info.err_not_allowed
+                    await callback(self, *args)
+        else:
+            @functools.wraps(callback)
+            async def _callback(self: ASGIHTTPEndpoint, *args) -> None:
+                # Origin
+                origin = self.get_header("Origin")
+                if origin:
+                    self.add_header("Access-Control-Allow-Origin", "*")
 
-            # Credentials
-            if info.allow_credentials:
-                self.add_header("Access-Control-Allow-Credentials", "true")
+                # Credentials
+                if allow_credentials:
+                    self.add_header("Access-Control-Allow-Credentials", "true")
 
-            if info.add_arg:
-                await callback(self, origin, *args)
-            else:
-                await callback(self, *args)
+                if add_arg:
+                    await callback(self, origin, *args)
+                else:
+                    await callback(self, *args)
 
         if info.err_not_allowed:
             _callback = may_occur(info.err_not_allowed.__class__)(_callback)
@@ -1023,7 +1164,7 @@ def allow_simple_access_control(
     add_arg: bool = True,
 ) -> CallbackDecorator_t:
     info = SimpleAccessControlInfo(
-        origins,
+        frozenset(origins),
         allow_credentials,
         err_not_allowed,
         add_arg,
@@ -1039,12 +1180,18 @@ def allow_simple_access_control(
 # NOTE
 #   Each values should be lowercases.
 
-_CORS_SAFELISTED_REQUEST_HEADERS = {
+_CORS_SAFELISTED_REQUEST_HEADERS = frozenset((
     "accept",
     "accept-language",
     "content-language",
     "content-type",
-}
+))
+
+# NOTE
+#   Browsers cache results of preflight requests only when the response
+#   has Access-Control-Max-Age, so it is sent by default. 600 seconds is
+#   within the caps which major browsers impose.
+_CORS_DEFAULT_MAX_AGE = 600
 
 
 def _handle_cors_preflight(
@@ -1052,7 +1199,7 @@ def _handle_cors_preflight(
     allow_origins: t.Iterable[str] = (),
     allow_headers: t.Iterable[str] = (),
     expose_headers: t.Iterable[str] = (),
-    max_age: t.Optional[int] = None,
+    max_age: t.Optional[int] = _CORS_DEFAULT_MAX_AGE,
     allow_credentials: bool = False,
     err_not_allowed_origin: ErrInfo = DEFAULT_CORS_ERROR,
     err_not_allowed_method: ErrInfo = DEFAULT_CORS_ERROR,
@@ -1066,63 +1213,100 @@ def _handle_cors_preflight(
     None
 ]:
     if isinstance(allow_methods, str):
-        allow_methods = {allow_methods}
-    allow_origins = set(allow_origins)
-    allow_headers = set([header.lower() for header in allow_headers])
-    allow_headers.update(_CORS_SAFELISTED_REQUEST_HEADERS)
+        allow_methods = (allow_methods,)
+    else:
+        allow_methods = tuple(allow_methods)
+    methods = ", ".join(allow_methods)
+    allow_methods = frozenset(allow_methods)
+    allow_origins = frozenset(allow_origins)
+    allow_headers = frozenset(header.lower() for header in allow_headers)
+    allow_headers |= _CORS_SAFELISTED_REQUEST_HEADERS
     expose_headers = ", ".join(expose_headers)
-    if max_age:
-        max_age = str(max_age)
 
-    def handle(
-        self: t.Union[ASGIHTTPEndpoint, WSGIEndpoint],
-        origin: t.Optional[str],
-        req_method: t.Optional[str],
-        req_headers: t.Optional[str],
-    ) -> None:
-        if origin is None and req_method is None:
-            self.send_only_status(HTTPStatus.BAD_REQUEST)
+    # Headers independent of requests are made in advance
+    static_headers = []
+    if expose_headers:
+        static_headers.append(
+            ("Access-Control-Expose-Headers", expose_headers)
+        )
+    if max_age:
+        static_headers.append(("Access-Control-Max-Age", str(max_age)))
+    if allow_credentials:
+        static_headers.append(("Access-Control-Allow-Credentials", "true"))
+    static_headers = tuple(static_headers)
 
-        # Allow Origin
-        if not len(allow_origins):
-            self.add_header("Access-Control-Allow-Origin", "*")
-        else:
-            if origin in allow_origins:
-                self.add_header("Access-Control-Allow-Origin", origin)
-                self.add_header("Vary", "Origin")
-            else:
-                raise err_not_allowed_origin
+    header_methods = ("Access-Control-Allow-Methods", methods)
 
-        # Allow Methods
-        if req_method is None:
-            raise err_not_allowed_method
-        if req_method in allow_methods:
-            methods = ", ".join(allow_methods)
-            self.add_header("Access-Control-Allow-Methods", methods)
-        else:
-            raise err_not_allowed_method
-
-        # Allow Headers
+    def accept_headers(self, req_headers: t.Optional[str]) -> None:
+        # NOTE
+        #   Header names are case-insensitive, and allowed ones have been
+        #   lowercased, so requested ones are compared in lowercase too.
         if req_headers:
             accepted_headers = ", ".join([
-                header for header in re.split(",|, ", req_headers)
+                header for header in map(
+                    str.strip, req_headers.lower().split(",")
+                )
                 if header in allow_headers
             ])
             if accepted_headers:
                 self.add_header("Access-Control-Allow-Headers", accepted_headers)
 
-        # Expose Headers
-        if expose_headers:
-            self.add_header("Access-Control-Expose-Headers", expose_headers)
+    # Headers of origins are specialized by the number of origins specified
+    if len(allow_origins) > 1:
+        def get_origin_headers(
+            origin: t.Optional[str],
+        ) -> t.Tuple[t.Tuple[str, str], ...]:
+            if origin not in allow_origins:
+                raise err_not_allowed_origin
+            return (
+                ("Access-Control-Allow-Origin", origin),
+                ("Vary", "Origin"),
+                header_methods,
+            )
+    elif allow_origins:
+        # NOTE
+        #   Allow Origin of the only origin doesn't vary by requests, so
+        #   Vary is omitted. Responses to OPTIONS aren't cached by shared
+        #   caches, and browsers key their preflight caches by origins.
+        (allowed_origin,) = allow_origins
+        headers_origin = (
+            ("Access-Control-Allow-Origin", allowed_origin),
+            header_methods,
+        )
+
+        def get_origin_headers(
+            origin: t.Optional[str],
+        ) -> t.Tuple[t.Tuple[str, str], ...]:
+            if origin != allowed_origin:
+                raise err_not_allowed_origin
+            return headers_origin
+    else:
+        # Allow Origin is independent of requests without any origins
+        headers_origin = (
+            ("Access-Control-Allow-Origin", "*"),
+            header_methods,
+        )
 
-        # Max Age
-        if max_age:
-            self.add_header("Access-Control-Max-Age", max_age)
+        def get_origin_headers(
+            origin: t.Optional[str],
+        ) -> t.Tuple[t.Tuple[str, str], ...]:
+            return headers_origin
 
-        # Allow Credentials
-        if allow_credentials:
-            self.add_header("Access-Control-Allow-Credentials", "true")
+    def handle(
+        self: t.Union[ASGIHTTPEndpoint, WSGIEndpoint],
+        origin: t.Optional[str],
+        req_method: t.Optional[str],
+        req_headers: t.Optional[str],
+    ) -> None:
+        if origin is None and req_method is None:
+            self.send_only_status(HTTPStatus.BAD_REQUEST)
+        headers_origin = get_origin_headers(origin)
+        if req_method not in allow_methods:
+            raise err_not_allowed_method
 
+        self.add_headers(*headers_origin)
+        accept_headers(self, req_headers)
+        self.add_headers(*static_headers)
         self.send_only_status(HTTPStatus.NO_CONTENT)
 
     return handle
@@ -1133,7 +1317,7 @@ def get_wsgi_preflight(
     allow_origins: t.Iterable[str] = (),
     allow_headers: t.Iterable[str] = (),
     expose_headers: t.Iterable[str] = (),
-    max_age: t.Optional[int] = None,
+    max_age: t.Optional[int] = _CORS_DEFAULT_MAX_AGE,
     allow_credentials: bool = False,
     err_not_allowed_origin: ErrInfo = DEFAULT_CORS_ERROR,
     err_not_allowed_method: ErrInfo = DEFAULT_CORS_ERROR,
@@ -1168,7 +1352,7 @@ def get_asgi_preflight(
     allow_origins: t.Iterable[str] = (),
     allow_headers: t.Iterable[str] = (),
     expose_headers: t.Iterable[str] = (),
-    max_age: t.Optional[int] = None,
+    max_age: t.Optional[int] = _CORS_DEFAULT_MAX_AGE,
     allow_credentials: bool = False,
     err_not_allowed_origin: ErrInfo = DEFAULT_CORS_ERROR,
     err_not_allowed_method: ErrInfo = DEFAULT_CORS_ERROR,
@@ -1198,14 +1382,14 @@ def get_asgi_preflight(
     return do_OPTIONS
 
 
-@dataclasses.dataclass(eq=True, frozen=True)
+@dataclasses.dataclass(**_INFO_OPTIONS)
 class PreFlightInfo:
 
-    allow_methods: t.Tuple[str]
-    allow_origins: t.Tuple[str] = ()
-    allow_headers: t.Tuple[str] = ()
-    expose_headers: t.Tuple[str] = ()
-    max_age: t.Optional[int] = None
+    allow_methods: t.Tuple[str, ...]
+    allow_origins: t.FrozenSet[str] = frozenset()
+    allow_headers: t.FrozenSet[str] = frozenset()
+    expose_headers: t.Tuple[str, ...] = ()
+    max_age: t.Optional[int] = _CORS_DEFAULT_MAX_AGE
     allow_credentials: bool = False
     err_not_allowed_origin: ErrInfo = DEFAULT_CORS_ERROR
     err_not_allowed_method: ErrInfo = DEFAULT_CORS_ERROR
@@ -1270,7 +1454,7 @@ def add_preflight(
     allow_origins: t.Iterable[str] = (),
     allow_headers: t.Iterable[str] = (),
     expose_headers: t.Iterable[str] = (),
-    max_age: t.Optional[int] = None,
+    max_age: t.Optional[int] = _CORS_DEFAULT_MAX_AGE,
     allow_credentials: bool = False,
     err_not_allowed_origin: ErrInfo = DEFAULT_CORS_ERROR,
     err_not_allowed_method: ErrInfo = DEFAULT_CORS_ERROR,
@@ -1278,8 +1462,8 @@ def add_preflight(
 ) -> t.Callable[[HTTPMixIn], HTTPMixIn]:
     info = PreFlightInfo(
         tuple(allow_methods),
-        allow_origins=tuple(allow_origins),
-        allow_headers=tuple(allow_headers),
+        allow_origins=frozenset(allow_origins),
+        allow_headers=frozenset(allow_headers),
         expose_headers=tuple(expose_headers),
         max_age=max_age,
         allow_credentials=allow_credentials,
@@ -1295,7 +1479,7 @@ def add_preflight(
     return wrapper
 
 
-@dataclasses.dataclass(eq=True, frozen=True)
+@dataclasses.dataclass(**_INFO_OPTIONS)
 class CacheControlInfo:
 
     public: bool = False
@@ -1497,7 +1681,7 @@ def _handle_cookie(
     return set_cookie_value
 
 
-@dataclasses.dataclass(eq=True, frozen=True)
+@dataclasses.dataclass(**_INFO_OPTIONS)
 class CookieInfo:
 
     cookie_name: str
@@ -35,6 +35,12 @@ class TestUnionData(JsonApiData):
     age: t.Optional[int] = None
 
 
+class TestOptionalListData(JsonApiData):
+
+    accounts: t.Optional[t.List[TestInnerData]]
+    datetime: str
+
+
 data_inner = json.dumps({
     "age": 18, "email": "hoge@hoge.com", "name": "hogehoge"
 }).encode()
@@ -58,6 +64,10 @@ data_union = json.dumps({
     "name": "hogehoge", "age": None,
 }).encode()
 
+data_optional_list_none = json.dumps({
+    "accounts": None, "datetime": "2000.01.01-00:00:00"
+}).encode()
+
 data_invalid_type = json.dumps({
     "name": 19, "age": 20,
 }).encode()
@@ -101,6 +111,18 @@ class TestJsonValidation(unittest.TestCase):
         self.assertEqual(data.name, "hogehoge")
         self.assertEqual(data.age, None)
 
+    def test_optional_list_data(self):
+        data = TestOptionalListData.__validate__(data_list, json_content_type)
+        self.assertTrue(isinstance(data.accounts[0], TestInnerData))
+        self.assertEqual(data.accounts[0].name, "hogehoge")
+
+        data = TestOptionalListData.__validate__(
+            data_optional_list_none,
+            json_content_type,
+        )
+        self.assertIsNone(data.accounts)
+        self.assertEqual(data.datetime, "2000.01.01-00:00:00")
+
     def test_invalid_type(self):
         with self.assertRaises(ApiValidationFailedError) as err:
             data = TestUnionData.__validate__(data_invalid_type, json_content_type)
@@ -1,5 +1,7 @@
+from enum import Enum
 import random
 import string
+import threading
 import typing as t
 import unittest
 
@@ -44,18 +46,17 @@ class TestRouting(unittest.TestCase):
         paths = list(set(rand_strings(30)))
 
         def client():
-            for i, path in enumerate(paths):
-                uri = f"http://localhost:{8000 + i}/{path}"
+            for path in paths:
+                uri = f"http://localhost:8000/{path}"
                 with http.get(uri) as res:
                     self.assertEqual(res.body, IDEAL_RESNPONSE)
 
-        forms = []
-        for i, path in enumerate(paths):
-            app = WSGIApp()
+        app = WSGIApp()
+        for path in paths:
             app.route(path)(MockEndpoint)
-            forms.append(WSGIServerForm("", 8000 + i, app, PATH_SERVER_LOG))
+        form = WSGIServerForm("", 8000, app, PATH_SERVER_LOG)
 
-        WSGITestExecutor(*forms).exec(client)
+        WSGITestExecutor(form).exec(client)
 
     def assertDuplicatedUris(self, patterns):
         router = Router()
@@ -84,6 +85,166 @@ class TestRouting(unittest.TestCase):
         self.assertDuplicatedUris(pattern_2)
         self.assertDuplicatedUris(pattern_3)
 
+    def test_register_many(self):
+        router = Router()
+        router.register_many([
+            (("test", "hoge"), MockEndpoint),
+            (("test", AsciiDigitLocation(4), "image"), MockEndpoint),
+        ], version="v1")
+
+        self.assertEqual(router.validate("/v1/test/hoge"), ((), MockEndpoint))
+        self.assertEqual(
+            router.validate("/v1/test/1234/image"),
+            (("1234",), MockEndpoint),
+        )
+        self.assertEqual(len(router.search_uris(MockEndpoint)), 2)
+
+        with self.assertRaises(DuplicatedUriRegisteredError):
+            router.register_many([(("test", "hoge"), MockEndpoint)])
+
+    def test_validate(self):
+        class OtherEndpoint(MockEndpoint):
+            pass
+
+        router = Router()
+        loc_digit = AsciiDigitLocation(4)
+        router.register(("test", "hoge"), MockEndpoint)
+        router.register(("test", loc_digit, "image"), MockEndpoint)
+        router.register((AnyStringLocation(), "hoge", "data"), OtherEndpoint)
+
+        self.assertEqual(router.validate("/test/hoge"), ((), MockEndpoint))
+        self.assertEqual(
+            router.validate("/test/1234/image"),
+            (("1234",), MockEndpoint),
+        )
+        self.assertEqual(
+            router.validate("/test/hoge/data"),
+            (("test",), OtherEndpoint),
+        )
+        self.assertEqual(router.validate("/test/123/image"), ((), None))
+        self.assertEqual(router.validate("/test"), ((), None))
+        self.assertEqual(router.validate("/"), ((), None))
+
+    def test_validate_registration_order(self):
+        class OtherEndpoint(MockEndpoint):
+            pass
+
+        # The first registered URI pattern wins even if the static
+        # location of the other one matches
+        router = Router()
+        router.register(
+            (AnyStringLocation(), AnyStringLocation(), "x"),
+            MockEndpoint,
+        )
+        router.register(
+            (AnyStringLocation(), "x"),
+            OtherEndpoint,
+            version="v1",
+        )
+        self.assertEqual(
+            router.validate("/v1/q/x"),
+            (("v1", "q"), MockEndpoint),
+        )
+
+        router = Router()
+        router.register(
+            (AnyStringLocation(), "x"),
+            OtherEndpoint,
+            version="v1",
+        )
+        router.register(
+            (AnyStringLocation(), AnyStringLocation(), "x"),
+            MockEndpoint,
+        )
+        self.assertEqual(
+            router.validate("/v1/q/x"),
+            (("q",), OtherEndpoint),
+        )
+
+    def test_validate_trailing_slash(self):
+        router = Router()
+        router.register(("test", "hoge"), MockEndpoint)
+        router.register(("test", AsciiDigitLocation(4), "image"), MockEndpoint)
+
+        self.assertEqual(router.validate("/test/hoge/"), ((), MockEndpoint))
+        self.assertEqual(
+            router.validate("/test/1234/image/"),
+            (("1234",), MockEndpoint),
+        )
+        self.assertEqual(router.validate("/test/"), ((), None))
+
+        # Slashes at the both ends are ignored, including the leading one
+        for uri in ("test/hoge", "test/hoge/", "//test/hoge", "/test/hoge//"):
+            self.assertEqual(router.validate(uri), ((), MockEndpoint))
+        for uri in ("test/1234/image", "//test/1234/image//"):
+            self.assertEqual(router.validate(uri), (("1234",), MockEndpoint))
+
+        # Repeated slashes between locations are not ignored
+        self.assertEqual(router.validate("/test//hoge"), ((), None))
+        self.assertEqual(router.validate("/test//1234/image"), ((), None))
+
+    def test_validate_slash_in_location(self):
+        class OtherEndpoint(MockEndpoint):
+            pass
+
+        router = Router()
+        router.register(("test", "hoge"), MockEndpoint)
+        router.register(("test/hoge",), OtherEndpoint)
+        self.assertEqual(router.validate("/test/hoge"), ((), MockEndpoint))
+
+        router = Router()
+        router.register(("test/hoge",), OtherEndpoint)
+        self.assertEqual(router.validate("/test/hoge"), ((), None))
+
+    def test_validate_str_subclass(self):
+        class Loc(str, Enum):
+            API = "api"
+            X = "x"
+
+        router = Router()
+        router.register((Loc.API, Loc.X), MockEndpoint, version=Loc.API)
+        self.assertEqual(router.validate("/api/api/x"), ((), MockEndpoint))
+
+    def test_validate_after_register(self):
+        router = Router()
+        router.register(("test", AsciiDigitLocation(4)), MockEndpoint)
+        self.assertEqual(router.validate("/hoge/image/data"), ((), None))
+
+        router.register(
+            (AnyStringLocation(), "image", "data"),
+            MockEndpoint,
+        )
+        self.assertEqual(
+            router.validate("/hoge/image/data"),
+            (("hoge",), MockEndpoint),
+        )
+
+    def test_validate_while_registering(self):
+        router = Router()
+        router.register(("test", AnyStringLocation()), MockEndpoint)
+        uris = [("test", str(i), "data") for i in range(200)]
+
+        def register_all() -> None:
+            for uri in uris:
+                router.register(uri, MockEndpoint)
+
+        thread = threading.Thread(target=register_all)
+        thread.start()
+        while thread.is_alive():
+            router.validate("/test/hoge")
+            router.validate("/test/1/data")
+        thread.join()
+
+        for i in range(200):
+            self.assertEqual(
+                router.validate(f"/test/{i}/data"),
+                ((), MockEndpoint),
+            )
+        self.assertEqual(
+            router.validate("/test/hoge"),
+            (("hoge",), MockEndpoint),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,217 @@
+import unittest
+
+from bamboo import (
+    ASGIApp,
+    ASGIHTTPEndpoint,
+    WSGIApp,
+    WSGIEndpoint,
+    WSGIServerForm,
+    WSGITestExecutor,
+)
+from bamboo.request import http
+from bamboo.sticky.http import add_preflight
+
+from ... import get_log_name
+from ...asgi_util import ASGIServerForm, ASGITestExecutor
+
+
+app_asgi = ASGIApp()
+app_wsgi = WSGIApp()
+PATH_ASGI_SERVER_LOG = get_log_name(__file__, "asgi")
+PATH_WSGI_SERVER_LOG = get_log_name(__file__, "wsgi")
+ORIGIN_ALLOWED = "http://allowed.example.com"
+ORIGIN_ALLOWED_OTHER = "http://allowed-other.example.com"
+ORIGIN_NOT_ALLOWED = "http://not-allowed.example.com"
+HEADERS_PREFLIGHT = {
+    "Origin": ORIGIN_ALLOWED,
+    "Access-Control-Request-Method": "POST",
+    "Access-Control-Request-Headers": "X-Custom-Header, Content-Type,x-other",
+}
+
+
+@app_asgi.route()
+@add_preflight(
+    ["GET", "POST"],
+    allow_origins=[ORIGIN_ALLOWED],
+    allow_headers=["x-custom-header"],
+    add_arg=False,
+)
+class TestASGIHTTPEndpoint(ASGIHTTPEndpoint):
+
+    async def do_GET(self) -> None:
+        self.send_only_status()
+
+    async def do_POST(self) -> None:
+        self.send_only_status()
+
+
+@app_wsgi.route()
+@add_preflight(
+    ["GET", "POST"],
+    allow_origins=[ORIGIN_ALLOWED],
+    allow_headers=["x-custom-header"],
+    add_arg=False,
+)
+class TestWSGIEndpoint(WSGIEndpoint):
+
+    def do_GET(self) -> None:
+        self.send_only_status()
+
+    def do_POST(self) -> None:
+        self.send_only_status()
+
+
+@app_asgi.route("origins")
+@add_preflight(
+    ["GET", "POST"],
+    allow_origins=[ORIGIN_ALLOWED, ORIGIN_ALLOWED_OTHER],
+    add_arg=False,
+)
+class TestASGIHTTPEndpointOrigins(ASGIHTTPEndpoint):
+
+    async def do_GET(self) -> None:
+        self.send_only_status()
+
+
+@app_wsgi.route("origins")
+@add_preflight(
+    ["GET", "POST"],
+    allow_origins=[ORIGIN_ALLOWED, ORIGIN_ALLOWED_OTHER],
+    add_arg=False,
+)
+class TestWSGIEndpointOrigins(WSGIEndpoint):
+
+    def do_GET(self) -> None:
+        self.send_only_status()
+
+
+@app_asgi.route("wildcard")
+@add_preflight(["GET", "POST"], add_arg=False)
+class TestASGIHTTPEndpointWildcard(ASGIHTTPEndpoint):
+
+    async def do_GET(self) -> None:
+        self.send_only_status()
+
+
+@app_wsgi.route("wildcard")
+@add_preflight(["GET", "POST"], add_arg=False)
+class TestWSGIEndpointWildcard(WSGIEndpoint):
+
+    def do_GET(self) -> None:
+        self.send_only_status()
+
+
+class TestStickyAddPreflight(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        form_asgi = ASGIServerForm("", 8000, app_asgi, PATH_ASGI_SERVER_LOG)
+        form_wsgi = WSGIServerForm("", 8001, app_wsgi, PATH_WSGI_SERVER_LOG)
+        cls.executor_asgi = ASGITestExecutor(form_asgi).start_serve()
+        cls.executor_wsgi = WSGITestExecutor(form_wsgi).start_serve()
+        cls.uri_asgi = "http://localhost:8000"
+        cls.uri_wsgi = "http://localhost:8001"
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.executor_asgi.close()
+        cls.executor_wsgi.close()
+
+    def check_allowed(self, uri: str) -> None:
+        with http.options(uri, headers=HEADERS_PREFLIGHT) as res:
+            self.assertTrue(res.ok)
+            self.assertEqual(
+                res.get_header("Access-Control-Allow-Origin"),
+                ORIGIN_ALLOWED,
+            )
+            self.assertEqual(
+                res.get_header("Access-Control-Allow-Methods"),
+                "GET, POST",
+            )
+            self.assertEqual(
+                res.get_header("Access-Control-Allow-Headers"),
+                "x-custom-header, content-type",
+            )
+            self.assertEqual(res.get_header("Access-Control-Max-Age"), "600")
+            self.assertIsNone(res.get_header("Vary"))
+
+    def check_not_allowed(self, uri: str) -> None:
+        headers = dict(HEADERS_PREFLIGHT, Origin=ORIGIN_NOT_ALLOWED)
+        with http.options(uri, headers=headers) as res:
+            self.assertFalse(res.ok)
+
+        headers = dict(HEADERS_PREFLIGHT)
+        headers["Access-Control-Request-Method"] = "DELETE"
+        with http.options(uri, headers=headers) as res:
+            self.assertFalse(res.ok)
+
+    def check_origins(self, uri: str) -> None:
+        uri = uri + "/origins"
+        for origin in (ORIGIN_ALLOWED, ORIGIN_ALLOWED_OTHER):
+            headers = dict(HEADERS_PREFLIGHT, Origin=origin)
+            with http.options(uri, headers=headers) as res:
+                self.assertTrue(res.ok)
+                self.assertEqual(
+                    res.get_header("Access-Control-Allow-Origin"),
+                    origin,
+                )
+                self.assertEqual(res.get_header("Vary"), "Origin")
+                self.assertEqual(
+                    res.get_header("Access-Control-Allow-Methods"),
+                    "GET, POST",
+                )
+                self.assertEqual(
+                    res.get_header("Access-Control-Allow-Headers"),
+                    "content-type",
+                )
+
+        self.check_not_allowed(uri)
+
+    def check_wildcard(self, uri: str) -> None:
+        uri = uri + "/wildcard"
+        for origin in (ORIGIN_ALLOWED, ORIGIN_NOT_ALLOWED):
+            headers = dict(HEADERS_PREFLIGHT, Origin=origin)
+            with http.options(uri, headers=headers) as res:
+                self.assertTrue(res.ok)
+                self.assertEqual(
+                    res.get_header("Access-Control-Allow-Origin"),
+                    "*",
+                )
+                self.assertIsNone(res.get_header("Vary"))
+                self.assertEqual(
+                    res.get_header("Access-Control-Allow-Methods"),
+                    "GET, POST",
+                )
+
+        headers = dict(HEADERS_PREFLIGHT)
+        headers["Access-Control-Request-Method"] = "DELETE"
+        with http.options(uri, headers=headers) as res:
+            self.assertFalse(res.ok)
+
+    def test_asgi_allowed(self):
+        self.check_allowed(self.uri_asgi)
+
+    def test_asgi_not_allowed(self):
+        self.check_not_allowed(self.uri_asgi)
+
+    def test_wsgi_allowed(self):
+        self.check_allowed(self.uri_wsgi)
+
+    def test_wsgi_not_allowed(self):
+        self.check_not_allowed(self.uri_wsgi)
+
+    def test_asgi_origins(self):
+        self.check_origins(self.uri_asgi)
+
+    def test_wsgi_origins(self):
+        self.check_origins(self.uri_wsgi)
+
+    def test_asgi_wildcard(self):
+        self.check_wildcard(self.uri_asgi)
+
+    def test_wsgi_wildcard(self):
+        self.check_wildcard(self.uri_wsgi)
+
+
+if __name__ == "__main__":
+    unittest.main()
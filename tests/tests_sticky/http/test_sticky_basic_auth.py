@@ -22,6 +22,7 @@ app_wsgi = WSGIApp()
 PATH_ASGI_SERVER_LOG = get_log_name(__file__, "asgi")
 PATH_WSGI_SERVER_LOG = get_log_name(__file__, "wsgi")
 RANDOM_CREDENTIALS = [(rand_string(10), rand_string(10)) for _ in range(10)]
+CREDENTIALS_WITH_COLONS = [("user", "p:w"), ("user", ":pw:"), ("user", "")]
 
 
 def make_basic_credential(user_id: str, pw: str) -> str:
@@ -35,6 +36,10 @@ class TestASGIHTTPEndpoint(ASGIHTTPEndpoint):
     async def do_HEAD(self, user_id: str, pw: str) -> None:
         self.send_only_status()
 
+    @basic_auth()
+    async def do_GET(self, user_id: str, pw: str) -> None:
+        self.send_body(f"{user_id}\n{pw}".encode())
+
 
 @app_wsgi.route()
 class TestWSGIEndpoint(WSGIEndpoint):
@@ -43,6 +48,10 @@ class TestWSGIEndpoint(WSGIEndpoint):
     def do_HEAD(self, user_id: str, pw: str) -> None:
         self.send_only_status()
 
+    @basic_auth()
+    def do_GET(self, user_id: str, pw: str) -> None:
+        self.send_body(f"{user_id}\n{pw}".encode())
+
 
 class TestStickyVasicAuth(unittest.TestCase):
 
@@ -60,6 +69,26 @@ class TestStickyVasicAuth(unittest.TestCase):
         cls.executor_asgi.close()
         cls.executor_wsgi.close()
 
+    def check_colons(self, uri: str) -> None:
+        # Only the first ':' separates user ID and password (RFC 7617)
+        for user_id, pw in CREDENTIALS_WITH_COLONS:
+            formatted = make_basic_credential(user_id, pw)
+            headers = {"Authorization": "Basic " + formatted}
+            with http.get(uri, headers=headers) as res:
+                self.assertTrue(res.ok)
+                self.assertEqual(res.body, f"{user_id}\n{pw}".encode())
+
+        formatted = encode_base64_string("user")
+        headers = {"Authorization": "Basic " + formatted}
+        with http.get(uri, headers=headers) as res:
+            self.assertFalse(res.ok)
+
+    def test_asgi_colons(self):
+        self.check_colons(self.uri_asgi)
+
+    def test_wsgi_colons(self):
+        self.check_colons(self.uri_wsgi)
+
     def test_asgi(self):
         for user_id, pw in RANDOM_CREDENTIALS:
             formatted = make_basic_credential(user_id, pw)
@@ -10,7 +10,11 @@ from bamboo import (
     WSGITestExecutor,
 )
 from bamboo.request import http
-from bamboo.sticky.http import ClientInfo, restricts_client
+from bamboo.sticky.http import (
+    ClientInfo,
+    _AcceptableClients,
+    restricts_client,
+)
 
 from ... import get_log_name
 from ...asgi_util import ASGIServerForm, ASGITestExecutor
@@ -87,5 +91,36 @@ class TestStickyRestrictsClient(unittest.TestCase):
             self.assertFalse(res.ok)
 
 
+class TestAcceptableClients(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.acceptables = _AcceptableClients()
+        self.acceptables.compile({
+            ipaddress.ip_address("::1"): {None},
+            ipaddress.ip_address("abcd::1"): {8000},
+            ipaddress.ip_address("127.0.0.1"): {8000, 8001},
+        })
+
+    def test_accepts_compressed(self):
+        self.assertTrue(self.acceptables.accepts("::1", 8000))
+        self.assertTrue(self.acceptables.accepts("abcd::1", 8000))
+        self.assertTrue(self.acceptables.accepts("127.0.0.1", 8001))
+        self.assertFalse(self.acceptables.accepts("::2", 8000))
+
+    def test_accepts_not_compressed(self):
+        for ip in ("0:0:0:0:0:0:0:1", "0000::0001", "::0:1"):
+            self.assertTrue(self.acceptables.accepts(ip, 8000))
+            self.assertTrue(self.acceptables.accepts(ip, None))
+        self.assertTrue(self.acceptables.accepts("ABCD:0::1", 8000))
+        self.assertFalse(self.acceptables.accepts("0:0:0:0:0:0:0:2", 8000))
+
+    def test_accepts_port(self):
+        self.assertFalse(self.acceptables.accepts("abcd::1", 8001))
+        self.assertFalse(self.acceptables.accepts("abcd::1", None))
+        self.assertFalse(self.acceptables.accepts("abcd:0:0::1", 8001))
+        self.assertFalse(self.acceptables.accepts("127.0.0.1", 8002))
+        self.assertFalse(self.acceptables.accepts("127.0.0.1", None))
+
+
 if __name__ == "__main__":
     unittest.main()